@@ -1,4 +1,7 @@
 import pytest
+from eth.codecs import abi
+
+from vyper.utils import method_id
 
 
 def test_assert_refund(env, get_contract, tx_failed):
@@ -208,3 +211,44 @@ def test() -> int128:
     c = get_contract(code)
     with tx_failed(exc_text="oops"):
         c.test()
+
+
+@pytest.mark.parametrize("reason", ["oops", "x" * 32, "a longer reason that spans two words"])
+def test_literal_reason_revert_data(get_contract, reason):
+    code = f"""
+REASON: constant(String[64]) = "{reason}"
+
+@external
+def literal():
+    raise "{reason}"
+
+@external
+def literal_assert(a: uint256):
+    assert a == 0, "{reason}"
+
+@external
+def from_constant():
+    raise REASON
+
+@external
+def dynamic(reason: String[64]):
+    raise reason
+
+@external
+def revert_data(data: Bytes[256]) -> Bytes[256]:
+    success: bool = False
+    response: Bytes[256] = b""
+    success, response = raw_call(self, data, max_outsize=256, revert_on_failure=False)
+    assert not success
+    return response
+    """
+    c = get_contract(code)
+
+    expected = method_id("Error(string)") + abi.encode("(string)", (reason,))
+
+    assert c.revert_data(method_id("literal()")) == expected
+    assert c.revert_data(method_id("literal_assert(uint256)") + (1).to_bytes(32, "big")) == expected
+    assert c.revert_data(method_id("from_constant()")) == expected
+
+    dynamic_calldata = method_id("dynamic(string)") + abi.encode("(string)", (reason,))
+    assert c.revert_data(dynamic_calldata) == expected
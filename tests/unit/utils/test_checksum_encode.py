@@ -0,0 +1,30 @@
+import pytest
+
+from vyper.utils import checksum_encode, is_checksum_encoded
+
+# test vectors from EIP-55
+EIP55_ADDRESSES = [
+    "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+    "0xfB6916095ca1df60bB79Ce92cE3Ea74c37c5d359",
+    "0xdbF03B407c01E7cD3CBea99509d93f8DDDC8C6FB",
+    "0xD1220A0cf47c7B9Be7A2E6BA89F429762e7b9aDb",
+    "0x52908400098527886E0F7030069857D2E4169EE7",
+    "0x8617E340B3D01FA5F11F306F4090FD50E238070D",
+    "0xde709f2102306220921060314715629080e2fb77",
+    "0x27b1fdb04752bbc536007a920d24acb045561c26",
+]
+
+
+@pytest.mark.parametrize("addr", EIP55_ADDRESSES)
+def test_checksum_encode(addr):
+    assert checksum_encode(addr.lower()) == addr
+    assert checksum_encode(addr.upper().replace("0X", "0x")) == addr
+    assert is_checksum_encoded(addr)
+
+
+@pytest.mark.parametrize("addr", EIP55_ADDRESSES)
+def test_is_checksum_encoded_rejects_bad_case(addr):
+    # flip the case of the last letter in the address
+    i = max(i for i, c in enumerate(addr) if c.isalpha() and i >= 2)
+    bad = addr[:i] + addr[i].swapcase() + addr[i + 1 :]
+    assert not is_checksum_encoded(bad)
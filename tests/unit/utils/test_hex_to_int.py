@@ -0,0 +1,37 @@
+import pytest
+
+from vyper.utils import hex_to_int
+
+
+@pytest.mark.parametrize(
+    "inp,expected",
+    [
+        ("0x", 0),
+        ("", 0),
+        ("0x00", 0),
+        ("0xff", 255),
+        ("0xFF00", 65280),
+        ("abcd", 43981),
+        ("0x" + "f" * 64, 2**256 - 1),
+        ("0x" + "00" * 31 + "01", 1),
+    ],
+)
+def test_hex_to_int(inp, expected):
+    assert hex_to_int(inp) == expected
+
+
+@pytest.mark.parametrize(
+    "inp",
+    [
+        "0xabc",  # odd length
+        "0x1_0",  # underscore separator
+        " 0xff",  # leading whitespace
+        "0xff ",  # trailing whitespace
+        "0x0x12",  # doubled prefix
+        "0xgg",  # non-hex digits
+        "-0x01",  # sign
+    ],
+)
+def test_hex_to_int_invalid(inp):
+    with pytest.raises(ValueError):
+        hex_to_int(inp)
@@ -0,0 +1,15 @@
+import pytest
+
+from vyper.utils import pow2_shift
+
+
+@pytest.mark.parametrize("n", [1, 2, 4, 2**8, 2**128, 2**255, 2**256])
+def test_pow2_shift_powers_of_two(n):
+    assert pow2_shift(n) == (True, n.bit_length() - 1)
+
+
+@pytest.mark.parametrize(
+    "n", [0, -1, -2, -(2**255), 3, 6, 255, 2**255 - 1, 2**255 + 1, 2**256 - 1]
+)
+def test_pow2_shift_non_powers_of_two(n):
+    assert pow2_shift(n) == (False, -1)
@@ -36,6 +36,8 @@ class VyperNode:
     @property
     def has_folded_value(self): ...
     @property
+    def is_terminus(self) -> bool: ...
+    @property
     def parent(self): ...
     @classmethod
     def get_fields(cls: Any) -> set: ...
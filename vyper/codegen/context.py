@@ -168,6 +168,20 @@ class Context:
         yield
         self.in_range_expr = prev_value
 
+    @contextlib.contextmanager
+    def loop_var(self, varname):
+        """
+        Loop variable context manager.
+
+        Marks ``varname`` as a for loop variable (so that it cannot be
+        assigned to) for the duration of the context.
+        """
+        self.forvars[varname] = True
+        try:
+            yield
+        finally:
+            self.forvars.pop(varname, None)
+
     @contextlib.contextmanager
     def internal_memory_scope(self):
         """
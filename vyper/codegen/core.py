@@ -1001,13 +1001,17 @@ def potential_overlap(left, right):
     if left.typ._is_prim_word and right.typ._is_prim_word:
         return False
 
-    if len(left.referenced_variables & right.referenced_variables) > 0:
+    # note: these are cached on the IRnode, so are only computed once
+    left_vars = left.referenced_variables
+    right_vars = right.referenced_variables
+
+    if not left_vars.isdisjoint(right_vars):
         return True
 
-    if len(left.referenced_variables) > 0 and right.contains_risky_call:
+    if len(left_vars) > 0 and right.contains_risky_call:
         return True
 
-    if left.contains_risky_call and len(right.referenced_variables) > 0:
+    if left.contains_risky_call and len(right_vars) > 0:
         return True
 
     return False
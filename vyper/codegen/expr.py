@@ -61,7 +61,7 @@ from vyper.semantics.types import (
 from vyper.semantics.types.bytestrings import _BytestringT
 from vyper.semantics.types.function import ContractFunctionT, MemberFunctionT
 from vyper.semantics.types.shortcuts import BYTES32_T, UINT256_T
-from vyper.utils import DECIMAL_DIVISOR, bytes_to_int, is_checksum_encoded
+from vyper.utils import DECIMAL_DIVISOR, bytes_to_words, is_checksum_encoded
 from vyper.warnings import VyperWarning, vyper_warn
 
 ENVIRONMENT_VARIABLES = {"block", "msg", "tx", "chain"}
@@ -84,11 +84,35 @@ class Expr:
             self.ir_node = fn()
             assert isinstance(self.ir_node, IRnode), self.ir_node
 
-        writes = set(access.variable for access in get_expr_writes(self.expr))
-        self.ir_node._writes = writes
+        self._attach_metadata(self.ir_node, self.expr)
 
-        self.ir_node.annotation = self.expr.get("node_source_code")
-        self.ir_node.ast_source = self.expr
+    @staticmethod
+    def _attach_metadata(ir_node, node):
+        writes = set(access.variable for access in get_expr_writes(node))
+        ir_node._writes = writes
+
+        ir_node.annotation = node.get("node_source_code")
+        ir_node.ast_source = node
+
+    @classmethod
+    def parse_local_var(cls, node, context):
+        """
+        Equivalent to `Expr(node, context).ir_node` for a Name which refers
+        to a local variable, but skips the generic dispatch.
+        """
+        assert isinstance(node, vy_ast.Name) and node.id in context.vars
+        ret = cls._local_var(node, context)
+        cls._attach_metadata(ret, node)
+        return ret
+
+    @staticmethod
+    def _local_var(node, context):
+        varinfo = node._expr_info.var_info
+        assert varinfo is not None
+
+        ret = context.lookup_var(node.id).as_ir_node()
+        ret._referenced_variables = {varinfo}
+        return ret
 
     def parse_Int(self):
         typ = self.expr._metadata["type"]
@@ -149,14 +173,8 @@ class Expr:
         placeholder = context.new_internal_variable(btype)
         seq = []
         seq.append(["mstore", placeholder, bytez_length])
-        for i in range(0, len(bytez), 32):
-            seq.append(
-                [
-                    "mstore",
-                    ["add", placeholder, i + 32],
-                    bytes_to_int((bytez + b"\x00" * 31)[i : i + 32]),
-                ]
-            )
+        for i, word in enumerate(bytes_to_words(bytez)):
+            seq.append(["mstore", ["add", placeholder, 32 * i + 32], word])
         return IRnode.from_list(
             ["seq"] + seq + [placeholder],
             typ=btype,
@@ -182,9 +200,7 @@ class Expr:
 
         # local variable
         if varname in self.context.vars:
-            ret = self.context.lookup_var(varname).as_ir_node()
-            ret._referenced_variables = {varinfo}
-            return ret
+            return self._local_var(self.expr, self.context)
 
         if varinfo.is_constant:
             return Expr.parse_value_expr(varinfo.decl_node.value, self.context)
@@ -640,9 +640,25 @@ class IRnode:
                 passthrough_metadata=passthrough_metadata,
             )
         else:
+            args = []
+            for o in obj[1:]:
+                if isinstance(o, IRnode):
+                    # fast path for children which are already IRnodes (e.g.
+                    # the statements in a `seq`): inherit metadata the same
+                    # way as the IRnode clause above, without recursing.
+                    if o.ast_source is None:
+                        o.ast_source = ast_source
+                    if o.encoding is None:
+                        o.encoding = Encoding.VYPER
+                    if o.error_msg is None:
+                        o.error_msg = error_msg
+                    args.append(o)
+                else:
+                    args.append(cls.from_list(o, ast_source=ast_source, error_msg=error_msg))
+
             return cls(
                 obj[0],
-                [cls.from_list(o, ast_source=ast_source, error_msg=error_msg) for o in obj[1:]],
+                args,
                 typ,
                 location=location,
                 annotation=annotation,
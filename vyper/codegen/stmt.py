@@ -23,17 +23,32 @@ from vyper.exceptions import CodegenPanic, StructureException, TypeCheckFailure,
 from vyper.semantics.types import DArrayT
 from vyper.semantics.types.shortcuts import UINT256_T
 
+# selector for `Error(string)`, used for revert reasons
+_ERROR_STRING_METHOD_ID = util.method_id_int("Error(string)")
+
+
+# the revert payload for a literal reason string is known at compile time:
+# `Error(string)` selector, then the abi-encoded `(string,)` -- offset,
+# length and zero-padded data words.
+def _literal_revert_words(reason: str) -> tuple[int, ...]:
+    bytez = reason.encode("utf-8")
+    return (_ERROR_STRING_METHOD_ID, 32, len(bytez), *util.bytes_to_words(bytez))
+
 
 class Stmt:
+    __slots__ = ("stmt", "context", "ir_node")
+
     def __init__(self, node: vy_ast.VyperNode, context: Context) -> None:
         self.stmt = node
         self.context = context
 
-        fn_name = f"parse_{type(node).__name__}"
-        with tag_exceptions(node, fallback_exception_type=CodegenPanic, note=fn_name):
-            fn = getattr(self, fn_name)
+        fn = self._DISPATCH.get(type(node))
+        if fn is None:  # pragma: nocover
+            raise CodegenPanic(f"Unsupported statement type: {type(node).__name__}", node)
+
+        with tag_exceptions(node, fallback_exception_type=CodegenPanic, note=fn.__name__):
             with context.internal_memory_scope():
-                self.ir_node = fn()
+                self.ir_node = fn(self)
 
             assert isinstance(self.ir_node, IRnode), self.ir_node
 
@@ -80,36 +95,46 @@ class Stmt:
         return IRnode.from_list(ret)
 
     def parse_If(self):
-        with self.context.block_scope():
-            test_expr = Expr.parse_value_expr(self.stmt.test, self.context)
-            body = ["if", test_expr, parse_body(self.stmt.body, self.context)]
+        stmt = self.stmt
+        context = self.context
 
-        if self.stmt.orelse:
-            with self.context.block_scope():
-                body.extend([parse_body(self.stmt.orelse, self.context)])
+        with context.block_scope():
+            test_expr = Expr.parse_value_expr(stmt.test, context)
+            body = ["if", test_expr, parse_body(stmt.body, context)]
+
+        if not stmt.orelse:
+            return IRnode.from_list(body)
+
+        # note: the else branch needs its own scope, so that variables
+        # declared in the if branch are released before it is lowered.
+        with context.block_scope():
+            body.append(parse_body(stmt.orelse, context))
 
         return IRnode.from_list(body)
 
     def parse_Log(self):
-        event = self.stmt._metadata["type"]
+        stmt = self.stmt
+        context = self.context
+
+        event = stmt._metadata["type"]
 
-        if len(self.stmt.value.keywords) > 0:
+        if len(stmt.value.keywords) > 0:
             # keyword arguments
-            to_compile = [arg.value for arg in self.stmt.value.keywords]
+            to_compile = [arg.value for arg in stmt.value.keywords]
         else:
             # positional arguments
-            to_compile = self.stmt.value.args
-        args = [Expr(arg, self.context).ir_node for arg in to_compile]
+            to_compile = stmt.value.args
 
         topic_ir = []
         data_ir = []
-        for arg, is_indexed in zip(args, event.indexed):
+        for arg, is_indexed in zip(to_compile, event.indexed):
+            ir = Expr(arg, context).ir_node
             if is_indexed:
-                topic_ir.append(arg)
+                topic_ir.append(ir)
             else:
-                data_ir.append(arg)
+                data_ir.append(ir)
 
-        return events.ir_node_for_log(self.stmt, event, topic_ir, data_ir, self.context)
+        return events.ir_node_for_log(stmt, event, topic_ir, data_ir, context)
 
     def _assert_reason(self, test_expr, msg):
         # from parse_Raise: None passed as the assert condition
@@ -123,39 +148,60 @@ class Stmt:
                     ["assert_unreachable", test_expr], error_msg="assert unreachable"
                 )
 
+        reduced_msg = msg.reduced()
+        if isinstance(reduced_msg, vy_ast.Str):
+            revert_seq = self._literal_revert(reduced_msg.value)
+        else:
+            revert_seq = self._revert_with_reason(msg)
+
+        if is_raise:
+            ir_node = revert_seq
+        else:
+            ir_node = ["if", ["iszero", test_expr], revert_seq]
+        return IRnode.from_list(ir_node, error_msg="user revert with reason")
+
+    def _literal_revert(self, reason):
+        # write the precomputed payload word-by-word to `buf`; the
+        # selector is right-aligned in the first word, so revert from buf+28
+        words = _literal_revert_words(reason)
+        buf = self.context.new_internal_variable(get_type_for_exact_size(32 * len(words)))
+
+        ret = ["seq"]
+        for i, word in enumerate(words):
+            ret.append(["mstore", add_ofst(buf, 32 * i), word])
+        ret.append(["revert", add_ofst(buf, 28), 32 * len(words) - 28])
+        return ret
+
+    def _revert_with_reason(self, msg):
+        context = self.context
+
         # set constant so that revert reason str is well behaved
         try:
-            tmp = self.context.constancy
-            self.context.constancy = Constancy.Constant
-            msg_ir = Expr(msg, self.context).ir_node
+            tmp = context.constancy
+            context.constancy = Constancy.Constant
+            msg_ir = Expr(msg, context).ir_node
         finally:
-            self.context.constancy = tmp
+            context.constancy = tmp
 
         msg_ir = wrap_value_for_external_return(msg_ir)
         bufsz = 64 + msg_ir.typ.memory_bytes_required
-        buf = self.context.new_internal_variable(get_type_for_exact_size(bufsz))
+        buf = context.new_internal_variable(get_type_for_exact_size(bufsz))
 
         # offset of bytes in (bytes,)
-        method_id = util.method_id_int("Error(string)")
+        method_id = _ERROR_STRING_METHOD_ID
 
         # abi encode method_id + bytestring to `buf+32`, then
         # write method_id to `buf` and get out of here
         payload_buf = add_ofst(buf, 32)
         bufsz -= 32  # reduce buffer by size of `method_id` slot
-        encoded_length = abi_encode(payload_buf, msg_ir, self.context, bufsz, returns_len=True)
+        encoded_length = abi_encode(payload_buf, msg_ir, context, bufsz, returns_len=True)
         with encoded_length.cache_when_complex("encoded_len") as (b1, encoded_length):
             revert_seq = [
                 "seq",
                 ["mstore", buf, method_id],
                 ["revert", add_ofst(buf, 28), ["add", 4, encoded_length]],
             ]
-            revert_seq = b1.resolve(revert_seq)
-
-        if is_raise:
-            ir_node = revert_seq
-        else:
-            ir_node = ["if", ["iszero", test_expr], revert_seq]
-        return IRnode.from_list(ir_node, error_msg="user revert with reason")
+            return b1.resolve(revert_seq)
 
     def parse_Assert(self):
         test_expr = Expr.parse_value_expr(self.stmt.test, self.context)
@@ -179,14 +225,33 @@ class Stmt:
                 return self._parse_For_list()
 
     def _parse_For_range(self):
-        assert "type" in self.stmt.target.target._metadata
-        target_type = self.stmt.target.target._metadata["type"]
+        stmt = self.stmt
+        context = self.context
 
-        range_call: vy_ast.Call = self.stmt.iter
+        assert "type" in stmt.target.target._metadata
+        target_type = stmt.target.target._metadata["type"]
+
+        range_call: vy_ast.Call = stmt.iter
         assert isinstance(range_call, vy_ast.Call)
 
-        with self.context.range_scope():
-            args = [Expr.parse_value_expr(arg, self.context) for arg in range_call.args]
+        if len(range_call.keywords) == 0:
+            # no `bound=` kwarg: semantic analysis requires both range args
+            # to be literal integers, so the round count is known statically.
+            literal_args = [arg.reduced() for arg in range_call.args]
+            assert all(isinstance(arg, vy_ast.Int) for arg in literal_args)
+            if len(literal_args) == 1:
+                start_val, end_val = 0, literal_args[0].value
+            elif len(literal_args) == 2:
+                start_val, end_val = (arg.value for arg in literal_args)
+            else:  # pragma: nocover
+                raise TypeCheckFailure("unreachable")
+
+            start = IRnode.from_list(start_val, typ=target_type)
+            rounds = end_val - start_val
+            return self._make_range_loop(target_type, start, rounds, rounds)
+
+        with context.range_scope():
+            args = [Expr.parse_value_expr(arg, context) for arg in range_call.args]
             if len(args) == 1:
                 start = IRnode.from_list(0, typ=target_type)
                 end = args[0]
@@ -195,78 +260,78 @@ class Stmt:
             else:  # pragma: nocover
                 raise TypeCheckFailure("unreachable")
 
-            kwargs = {
-                s.arg: Expr.parse_value_expr(s.value, self.context) for s in range_call.keywords
-            }
+            kwargs = {s.arg: Expr.parse_value_expr(s.value, context) for s in range_call.keywords}
 
+        assert "bound" in kwargs
         # sanity check that the following `end - start` is a valid operation
         assert start.typ == end.typ == target_type
 
         with start.cache_when_complex("start") as (b1, start):
-            if "bound" in kwargs:
-                with end.cache_when_complex("end") as (b2, end):
-                    # note: the check for rounds<=rounds_bound happens in asm
-                    # generation for `repeat`.
-                    clamped_start = clamp_le(start, end, target_type.is_signed)
-                    rounds = b2.resolve(IRnode.from_list(["sub", end, clamped_start]))
-                rounds_bound = kwargs.pop("bound").int_value()
-            else:
-                rounds = end.int_value() - start.int_value()
-                rounds_bound = rounds
+            with end.cache_when_complex("end") as (b2, end):
+                # note: the check for rounds<=rounds_bound happens in asm
+                # generation for `repeat`.
+                clamped_start = clamp_le(start, end, target_type.is_signed)
+                rounds = b2.resolve(IRnode.from_list(["sub", end, clamped_start]))
+            rounds_bound = kwargs.pop("bound").int_value()
 
             assert len(kwargs) == 0  # sanity check stray keywords
 
-            if rounds_bound < 1:  # pragma: nocover
-                raise TypeCheckFailure("unreachable: unchecked 0 bound")
+            return b1.resolve(self._make_range_loop(target_type, start, rounds, rounds_bound))
 
-            varname = self.stmt.target.target.id
-            i = IRnode.from_list(self.context.fresh_varname("range_ix"), typ=target_type)
-            iptr = self.context.new_variable(varname, target_type)
+    def _make_range_loop(self, target_type, start, rounds, rounds_bound):
+        stmt = self.stmt
+        context = self.context
 
-            self.context.forvars[varname] = True
+        if rounds_bound < 1:  # pragma: nocover
+            raise TypeCheckFailure("unreachable: unchecked 0 bound")
 
-            loop_body = ["seq"]
-            # store the current value of i so it is accessible to userland
-            loop_body.append(["mstore", iptr, i])
-            loop_body.append(parse_body(self.stmt.body, self.context))
+        varname = stmt.target.target.id
+        i = IRnode.from_list(context.fresh_varname("range_ix"), typ=target_type)
+        iptr = context.new_variable(varname, target_type)
 
-            del self.context.forvars[varname]
+        loop_body = ["seq"]
+        # store the current value of i so it is accessible to userland
+        loop_body.append(["mstore", iptr, i])
+        with context.loop_var(varname):
+            loop_body.append(parse_body(stmt.body, context))
 
-            # NOTE: codegen for `repeat` inserts an assertion that
-            # (gt rounds_bound rounds). note this also covers the case where
-            # rounds < 0.
-            # if we ever want to remove that, we need to manually add the assertion
-            # where it makes sense.
-            loop = ["repeat", i, start, rounds, rounds_bound, loop_body]
-            return b1.resolve(IRnode.from_list(loop, error_msg="range() bounds check"))
+        # NOTE: codegen for `repeat` inserts an assertion that
+        # (gt rounds_bound rounds). note this also covers the case where
+        # rounds < 0.
+        # if we ever want to remove that, we need to manually add the assertion
+        # where it makes sense.
+        loop = ["repeat", i, start, rounds, rounds_bound, loop_body]
+        return IRnode.from_list(loop, error_msg="range() bounds check")
 
     def _parse_For_list(self):
-        with self.context.range_scope():
-            iter_list = Expr(self.stmt.iter, self.context).ir_node
+        stmt = self.stmt
+        context = self.context
+
+        with context.range_scope():
+            iter_list = Expr(stmt.iter, context).ir_node
 
-        target_type = self.stmt.target.target._metadata["type"]
+        target_type = stmt.target.target._metadata["type"]
         assert target_type == iter_list.typ.value_type
 
         # user-supplied name for loop variable
-        varname = self.stmt.target.target.id
-        loop_var = self.context.new_variable(varname, target_type)
-
-        i = IRnode.from_list(self.context.fresh_varname("for_list_ix"), typ=UINT256_T)
+        varname = stmt.target.target.id
+        loop_var = context.new_variable(varname, target_type)
 
-        self.context.forvars[varname] = True
+        i = IRnode.from_list(context.fresh_varname("for_list_ix"), typ=UINT256_T)
 
         ret = ["seq"]
 
         # if it's a list literal, force it to memory first
         if not iter_list.is_pointer:
-            tmp_list = self.context.new_internal_variable(iter_list.typ)
+            tmp_list = context.new_internal_variable(iter_list.typ)
             ret.append(make_setter(tmp_list, iter_list))
             iter_list = tmp_list
 
         with iter_list.cache_when_complex("list_iter") as (b1, iter_list):
             # set up the loop variable
             e = get_element_ptr(iter_list, i, array_bounds_check=False)
-            body = ["seq", make_setter(loop_var, e), parse_body(self.stmt.body, self.context)]
+            with context.loop_var(varname):
+                body = ["seq", make_setter(loop_var, e), parse_body(stmt.body, context)]
 
             repeat_bound = iter_list.typ.count
             if isinstance(iter_list.typ, DArrayT):
@@ -275,8 +340,6 @@ class Stmt:
                 array_len = repeat_bound
 
             ret.append(["repeat", i, 0, array_len, repeat_bound, body])
-
-            del self.context.forvars[varname]
             return b1.resolve(IRnode.from_list(ret))
 
     def parse_AugAssign(self):
@@ -289,13 +352,13 @@ class Stmt:
             # single word load/stores are atomic.
             raise TypeCheckFailure("unreachable")
 
-        for var in target.referenced_variables:
-            if var.typ._is_prim_word:
-                continue
-            # oob - GHSA-4w26-8p97-f4jp
-            if var in right.variable_writes or (
-                var.is_state_variable() and right.contains_writeable_call
-            ):
+        # oob - GHSA-4w26-8p97-f4jp
+        non_prim_vars = [v for v in target.referenced_variables if not v.typ._is_prim_word]
+        if non_prim_vars:
+            writes = right.variable_writes
+            if any(v in writes for v in non_prim_vars):
+                raise CodegenPanic("unreachable")
+            if right.contains_writeable_call and any(v.is_state_variable() for v in non_prim_vars):
                 raise CodegenPanic("unreachable")
 
         with target.cache_when_complex("_loc") as (b, target):
@@ -321,6 +384,14 @@ class Stmt:
         if isinstance(target, vy_ast.Name) and target.id in self.context.forvars:  # pragma: nocover
             raise TypeCheckFailure(f"Failed constancy check\n{_dbg_expr}")
 
+        # fast path for the common case of assigning to a local variable;
+        # avoids the generic Expr dispatch.
+        if isinstance(target, vy_ast.Name) and target.id in self.context.vars:
+            ret = Expr.parse_local_var(target, self.context)
+            if not writeable(self.context, ret):  # pragma: nocover
+                raise TypeCheckFailure(f"Failed constancy check\n{_dbg_expr}")
+            return ret
+
         if isinstance(target, vy_ast.Tuple):
             target = Expr(target, self.context).ir_node
             items = target.args
@@ -333,9 +404,28 @@ class Stmt:
             raise TypeCheckFailure(f"Failed constancy check\n{_dbg_expr}")
         return target
 
+    # map each statement node type to its handler once, at class creation,
+    # rather than building and looking up the method name per statement.
+    _DISPATCH = {
+        vy_ast.Expr: parse_Expr,
+        vy_ast.Pass: parse_Pass,
+        vy_ast.Name: parse_Name,
+        vy_ast.AnnAssign: parse_AnnAssign,
+        vy_ast.Assign: parse_Assign,
+        vy_ast.If: parse_If,
+        vy_ast.Log: parse_Log,
+        vy_ast.Assert: parse_Assert,
+        vy_ast.Raise: parse_Raise,
+        vy_ast.For: parse_For,
+        vy_ast.AugAssign: parse_AugAssign,
+        vy_ast.Continue: parse_Continue,
+        vy_ast.Break: parse_Break,
+        vy_ast.Return: parse_Return,
+    }
+
 
 # Parse a statement (usually one line of code but not always)
-def parse_stmt(stmt, context):
+def parse_stmt(stmt: vy_ast.VyperNode, context: Context) -> IRnode:
     return Stmt(stmt, context).ir_node
 
 
@@ -343,24 +433,29 @@ def parse_stmt(stmt, context):
 # a function is terminated if it ends with a return stmt, OR,
 # it ends with an if/else and both branches are terminated.
 # (if not, we need to insert a terminator so that the IR is well-formed)
-def _is_terminated(code):
-    last_stmt = code[-1]
+def _is_terminated(code: list[vy_ast.VyperNode]) -> bool:
+    # walk `elif` chains (nested in `orelse`) iteratively, so that long
+    # chains do not cost a python frame per branch.
+    while True:
+        last_stmt = code[-1]
+
+        if last_stmt.is_terminus:
+            return True
+
+        if not isinstance(last_stmt, vy_ast.If) or not last_stmt.orelse:
+            return False
 
-    if last_stmt.is_terminus:
-        return True
+        if not _is_terminated(last_stmt.body):
+            return False
 
-    if isinstance(last_stmt, vy_ast.If):
-        if last_stmt.orelse:
-            return _is_terminated(last_stmt.body) and _is_terminated(last_stmt.orelse)
-    return False
+        code = last_stmt.orelse
 
 
 # codegen a list of statements
-def parse_body(code, context, ensure_terminated=False):
-    ir_node = ["seq"]
-    for stmt in code:
-        ir = parse_stmt(stmt, context)
-        ir_node.append(ir)
+def parse_body(
+    code: list[vy_ast.VyperNode], context: Context, ensure_terminated: bool = False
+) -> IRnode:
+    ir_node = ["seq"] + [parse_stmt(stmt, context) for stmt in code]
 
     # force using the return routine / exit_to cleanup for end of function
     if ensure_terminated and context.return_type is None and not _is_terminated(code):
@@ -10,8 +10,7 @@ from vyper.utils import (
     evm_mod,
     evm_pow,
     int_bounds,
-    int_log2,
-    is_power_of_two,
+    pow2_shift,
     signed_to_unsigned,
     unsigned_to_signed,
 )
@@ -333,24 +332,26 @@ def _optimize_binop(binop, args, ann, parent_op):
     #    new_val = "eq"
     #    args = args
 
-    if binop in {"mod", "div", "mul"} and _is_int(args[1]) and is_power_of_two(_int(args[1])):
-        assert unsigned == UNSIGNED, "something's not right."
-        # shave two gas off mod/div/mul for powers of two
-        # x % 2**n == x & (2**n - 1)
-        if binop == "mod":
-            return finalize("and", [args[0], _int(args[1]) - 1])
-
-        if binop == "div":
-            # x / 2**n == x >> n
-            # recall shr/shl have unintuitive arg order
-            return finalize("shr", [int_log2(_int(args[1])), args[0]])
-
-        # note: no rule for sdiv since it rounds differently from sar
-        if binop == "mul":
-            # x * 2**n == x << n
-            return finalize("shl", [int_log2(_int(args[1])), args[0]])
-
-        raise CompilerPanic("unreachable")  # pragma: no cover
+    if binop in {"mod", "div", "mul"} and _is_int(args[1]):
+        is_pow2, shift = pow2_shift(_int(args[1]))
+        if is_pow2:
+            assert unsigned == UNSIGNED, "something's not right."
+            # shave two gas off mod/div/mul for powers of two
+            # x % 2**n == x & (2**n - 1)
+            if binop == "mod":
+                return finalize("and", [args[0], _int(args[1]) - 1])
+
+            if binop == "div":
+                # x / 2**n == x >> n
+                # recall shr/shl have unintuitive arg order
+                return finalize("shr", [shift, args[0]])
+
+            # note: no rule for sdiv since it rounds differently from sar
+            if binop == "mul":
+                # x * 2**n == x << n
+                return finalize("shl", [shift, args[0]])
+
+            raise CompilerPanic("unreachable")  # pragma: no cover
 
     ##
     # COMPARISONS
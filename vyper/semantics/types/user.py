@@ -209,7 +209,8 @@ class EventT(_UserType):
         return f"event {self.name}({','.join(args)})"
 
     # TODO rename to abi_signature
-    @property
+    # note: cached since it is also used to annotate every log statement
+    @cached_property
     def signature(self):
         return f"{self.name}({','.join(v.canonical_abi_type for v in self.arguments.values())})"
 
@@ -1,15 +1,15 @@
-import binascii
 import contextlib
 import decimal
 import enum
 import functools
 import hashlib
 import os
+import re
 import sys
 import time
 import traceback
 import warnings
-from typing import Generic, Iterable, Iterator, List, Set, TypeVar, Union
+from typing import Dict, FrozenSet, Generic, Iterable, Iterator, List, Set, Tuple, TypeVar, Union
 
 from Crypto.Hash import keccak
 
@@ -27,6 +27,8 @@ class OrderedSet(Generic[_T]):
     functionality as needed.
     """
 
+    __slots__ = ("_data",)
+
     def __init__(self, iterable=None):
         if iterable is None:
             self._data = dict()
@@ -82,15 +84,24 @@ class OrderedSet(Generic[_T]):
         self._data.clear()
 
     def difference(self, other):
-        ret = self.copy()
-        ret.dropmany(other)
+        if isinstance(other, OrderedSet):
+            other_data = other._data
+        else:
+            other_data = set(other)
+        cls = self.__class__
+        ret = cls.__new__(cls)
+        ret._data = {k: None for k in self._data if k not in other_data}
         return ret
 
     def update(self, other):
-        # CMC 2024-03-22 for some reason, this is faster than dict.update?
-        # (maybe size dependent)
+        if isinstance(other, OrderedSet):
+            # dict-to-dict update is a single C call, and on current
+            # cpython is at least as fast as the loop below for all sizes
+            self._data.update(other._data)
+            return
+        d = self._data
         for item in other:
-            self._data[item] = None
+            d[item] = None
 
     def union(self, other):
         return self | other
@@ -101,11 +112,21 @@ class OrderedSet(Generic[_T]):
         return self
 
     def __or__(self, other):
-        ret = self.copy()
-        ret.update(other)
+        if isinstance(other, OrderedSet):
+            other_data = other._data
+        else:
+            other_data = dict.fromkeys(other)
+        cls = self.__class__
+        ret = cls.__new__(cls)
+        ret._data = {**self._data, **other_data}
         return ret
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, OrderedSet):
+            return NotImplemented
+        # note: dict equality already rejects on size mismatch first
         return self._data == other._data
 
     def __isub__(self, other):
@@ -113,9 +134,7 @@ class OrderedSet(Generic[_T]):
         return self
 
     def __sub__(self, other):
-        ret = self.copy()
-        ret.dropmany(other)
-        return ret
+        return self.difference(other)
 
     def copy(self):
         cls = self.__class__
@@ -128,9 +147,17 @@ class OrderedSet(Generic[_T]):
         if len(sets) == 0:
             raise ValueError("undefined: intersection of no sets")
 
-        tmp = sets[0]._data.keys()
-        for s in sets[1:]:
+        if len(sets) == 1:
+            return cls(sets[0])
+
+        # intersect smallest-first; the intermediate result can only shrink,
+        # so stop as soon as it is empty
+        ordered = sorted(sets, key=len)
+        tmp = ordered[0]._data.keys()
+        for s in ordered[1:]:
             tmp &= s._data.keys()
+            if not tmp:
+                break
 
         return cls(tmp)
 
@@ -149,6 +176,14 @@ def uniq(seq: Iterable[_T]) -> Iterator[_T]:
         yield x
 
 
+def uniq_list(seq: Iterable[_T]) -> List[_T]:
+    """
+    Return the unique items in ``seq`` in original sequence order.
+    Eager version of ``uniq``; the dedup loop runs in C.
+    """
+    return list(dict.fromkeys(seq))
+
+
 class StringEnum(enum.Enum):
     # Must be first, or else won't work, specifies what .value is
     @staticmethod
@@ -162,7 +197,18 @@ class StringEnum(enum.Enum):
 
     @classmethod
     def is_valid_value(cls, value: str) -> bool:
-        return value in set(o.value for o in cls)
+        return value in cls._values_set()
+
+    # members are fixed once the class is created, so these can be cached
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _values_set(cls) -> FrozenSet[str]:
+        return frozenset(o.value for o in cls)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _order_map(cls) -> Dict["StringEnum", int]:
+        return {o: i for i, o in enumerate(cls)}
 
     @classmethod
     def options(cls) -> List["StringEnum"]:
@@ -183,8 +229,8 @@ class StringEnum(enum.Enum):
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             raise CompilerPanic(f"bad comparison: ({type(other)}, {type(self)})")
-        options = self.__class__.options()
-        return options.index(self) < options.index(other)  # type: ignore
+        order = self.__class__._order_map()
+        return order[self] < order[other]  # type: ignore
 
     def __le__(self, other: object) -> bool:
         return self.__eq__(other) or self.__lt__(other)
@@ -244,14 +290,22 @@ def fourbytes_to_int(inp):
 
 # Converts an integer to four bytes
 def int_to_fourbytes(n: int) -> bytes:
+    # note: 2**32 is folded into a constant by the bytecode compiler
     assert n < 2**32
-    return n.to_bytes(4, byteorder="big")
+    return n.to_bytes(4, "big")
+
+
+_UINT256_MASK = (1 << 256) - 1
+_INT256_MAX = (1 << 255) - 1
+_UINT256_CEILING = 1 << 256
 
 
 def wrap256(val: int, signed=False) -> int:
-    ret = val % (2**256)
-    if signed:
-        ret = unsigned_to_signed(ret, 256, strict=True)
+    ret = val & _UINT256_MASK
+    # inlined unsigned_to_signed(ret, 256); after masking, ret is always
+    # within uint256 bounds so the strict check is not needed
+    if signed and ret > _INT256_MAX:
+        ret -= _UINT256_CEILING
     return ret
 
 
@@ -285,16 +339,17 @@ def unsigned_to_signed(int_, bits, strict=False):
     return int_
 
 
-def is_power_of_two(n: int) -> bool:
-    # busted for ints wider than 53 bits:
-    # t = math.log(n, 2)
-    # return math.ceil(t) == math.floor(t)
-    return n != 0 and ((n & (n - 1)) == 0)
-
-
 # https://stackoverflow.com/a/71122440/
-def int_log2(n: int) -> int:
-    return n.bit_length() - 1
+def pow2_shift(n: int) -> Tuple[bool, int]:
+    """
+    returns (True, log2(n)) if n is a power of two, otherwise (False, -1).
+    """
+    if n <= 0:
+        return False, -1
+    shift = n.bit_length() - 1
+    if n != 1 << shift:
+        return False, -1
+    return True, shift
 
 
 # utility function for debugging purposes
@@ -312,6 +367,7 @@ def method_id_int(method_sig: str) -> int:
     return fourbytes_to_int(method_id_bytes)
 
 
+@functools.lru_cache(maxsize=4096)
 def method_id(method_str: str) -> bytes:
     return keccak256(bytes(method_str, "utf-8"))[:4]
 
@@ -323,46 +379,69 @@ def round_towards_zero(d: decimal.Decimal) -> int:
     return int(d.to_integral_exact(decimal.ROUND_DOWN))
 
 
+# a whole number of bytes worth of hex digits
+_HEX_BYTES_RE = re.compile("(?:[0-9a-fA-F]{2})*")
+
+
 # Converts a provided hex string to an integer
 def hex_to_int(inp):
     if inp[:2] == "0x":
         inp = inp[2:]
-    return bytes_to_int(binascii.unhexlify(inp))
+    # int(..., 16) by itself also accepts odd lengths, underscores,
+    # surrounding whitespace and a second "0x" prefix; reject those
+    if _HEX_BYTES_RE.fullmatch(inp) is None:
+        raise ValueError(f"Invalid hex string: {inp!r}")
+    # "0x" alone is 0
+    return int(inp, 16) if inp else 0
 
 
 # Converts bytes to an integer
 def bytes_to_int(bytez):
-    o = 0
-    for b in bytez:
-        o = o * 256 + b
-    return o
+    return int.from_bytes(bytez, "big")
+
+
+# Splits bytes into right-padded 32-byte words. the same literal (e.g. a
+# revert reason) tends to show up at many sites, so memoize on the value.
+@functools.lru_cache(maxsize=512)
+def bytes_to_words(bytez: bytes) -> Tuple[int, ...]:
+    padded = bytez + b"\x00" * 31
+    return tuple(bytes_to_int(padded[i : i + 32]) for i in range(0, len(bytez), 32))
 
 
 def is_checksum_encoded(addr):
-    return addr == checksum_encode(addr)
+    # same as `addr == checksum_encode(addr)`, but bails out at the first
+    # character with the wrong case instead of building the whole string
+    assert addr[:2] == "0x" and len(addr) == 42, addr
+    addr_lower = addr[2:].lower()
+    nibbles = keccak256(addr_lower.encode("utf-8")).hex()
+    for c, lc, n in zip(addr[2:], addr_lower, nibbles):
+        if c != (lc.upper() if n >= "8" else lc):
+            return False
+    return True
 
 
 # Encodes an address using ethereum's checksum scheme
 def checksum_encode(addr):  # Expects an input of the form 0x<40 hex chars>
     assert addr[:2] == "0x" and len(addr) == 42, addr
-    o = ""
-    v = bytes_to_int(keccak256(addr[2:].lower().encode("utf-8")))
-    for i, c in enumerate(addr[2:]):
-        if c in "0123456789":
-            o += c
-        else:
-            o += c.upper() if (v & (2 ** (255 - 4 * i))) else c.lower()
+    addr_lower = addr[2:].lower()
+    # uppercase each letter whose corresponding nibble in the hash is >= 8
+    # (i.e. has its high bit set). digits are unaffected by upper().
+    nibbles = keccak256(addr_lower.encode("utf-8")).hex()
+    o = "".join(c.upper() if n >= "8" else c for c, n in zip(addr_lower, nibbles))
     return "0x" + o
 
 
 # Returns lowest multiple of 32 >= the input
 def ceil32(x):
-    return x if x % 32 == 0 else x + 32 - (x % 32)
+    # 32 is a power of two, so rounding up is an add and a mask
+    return (x + 31) & ~31
 
 
 # Calculates amount of gas needed for memory expansion
 def calc_mem_gas(memsize):
-    return (memsize // 32) * 3 + (memsize // 32) ** 2 // 512
+    # words * 3 + words**2 // 512, with the power-of-two divisions as shifts
+    words = memsize >> 5
+    return words * 3 + ((words * words) >> 9)
 
 
 # Specific gas usage
@@ -376,6 +455,7 @@ DECIMAL_DIVISOR = 10**MAX_DECIMAL_PLACES
 DECIMAL_EPSILON = decimal.Decimal(1) / DECIMAL_DIVISOR
 
 
+@functools.lru_cache(maxsize=None)
 def int_bounds(signed, bits):
     """
     calculate the bounds on an integer type
@@ -390,12 +470,12 @@ def int_bounds(signed, bits):
 # e.g. -1 -> -(2**256 - 1)
 def evm_twos_complement(x: int) -> int:
     # return ((o + 2 ** 255) % 2 ** 256) - 2 ** 255
-    return ((2**256 - 1) ^ x) + 1
+    return (_UINT256_MASK ^ x) + 1
 
 
 def evm_not(val: int) -> int:
-    assert 0 <= val <= SizeLimits.MAX_UINT256, "Value out of bounds"
-    return SizeLimits.MAX_UINT256 ^ val
+    assert 0 <= val <= _UINT256_MASK, "Value out of bounds"
+    return _UINT256_MASK ^ val
 
 
 # EVM div semantics as a python function
@@ -432,22 +512,30 @@ class MemoryPositions:
 
 # Sizes of different data types. Used to clamp types.
 class SizeLimits:
-    MAX_INT128 = 2**127 - 1
-    MIN_INT128 = -(2**127)
-    MAX_INT256 = 2**255 - 1
-    MIN_INT256 = -(2**255)
-    MAXDECIMAL = 2**167 - 1  # maxdecimal as EVM value
-    MINDECIMAL = -(2**167)  # mindecimal as EVM value
+    MAX_INT128 = (1 << 127) - 1
+    MIN_INT128 = -(1 << 127)
+    MAX_INT256 = _INT256_MAX
+    MIN_INT256 = -(1 << 255)
+    MAXDECIMAL = (1 << 167) - 1  # maxdecimal as EVM value
+    MINDECIMAL = -(1 << 167)  # mindecimal as EVM value
     # min decimal allowed as Python value
-    MIN_AST_DECIMAL = -decimal.Decimal(2**167) / DECIMAL_DIVISOR
+    # (scaleb shifts the exponent directly, no division needed)
+    MIN_AST_DECIMAL = decimal.Decimal(MINDECIMAL).scaleb(-MAX_DECIMAL_PLACES)
     # max decimal allowed as Python value
-    MAX_AST_DECIMAL = decimal.Decimal(2**167 - 1) / DECIMAL_DIVISOR
-    MAX_UINT8 = 2**8 - 1
-    MAX_UINT256 = 2**256 - 1
-    CEILING_UINT256 = 2**256
+    MAX_AST_DECIMAL = decimal.Decimal(MAXDECIMAL).scaleb(-MAX_DECIMAL_PLACES)
+    MAX_UINT8 = (1 << 8) - 1
+    MAX_UINT256 = _UINT256_MASK
+    CEILING_UINT256 = _UINT256_CEILING
+
+
+# quantize() only looks at the exponent of the quantizer, so the default
+# one can be built once instead of being re-parsed from a string per call
+_DEFAULT_QUANTIZER = decimal.Decimal(1).scaleb(-MAX_DECIMAL_PLACES)
 
 
 def quantize(d: decimal.Decimal, places=MAX_DECIMAL_PLACES, rounding_mode=decimal.ROUND_DOWN):
+    if places == MAX_DECIMAL_PLACES:
+        return d.quantize(_DEFAULT_QUANTIZER, rounding_mode)
     quantizer = decimal.Decimal(f"{1:0.{places}f}")
     return d.quantize(quantizer, rounding_mode)
 
@@ -500,6 +588,10 @@ SHA3_BASE = 30
 SHA3_PER_WORD = 6
 
 
+# line boundaries recognized by str.splitlines, other than "\n"
+_NON_LF_LINE_BREAK = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
 def indent(text: str, indent_chars: Union[str, List[str]] = " ", level: int = 1) -> str:
     """
     Indent lines of text in the string ``text`` using the indentation
@@ -513,6 +605,17 @@ def indent(text: str, indent_chars: Union[str, List[str]] = " ", level: int = 1)
 
     :return: The indented text.
     """
+    if isinstance(indent_chars, str) and not _NON_LF_LINE_BREAK.search(text):
+        # fast path: with only "\n" line breaks, prefixing every line is a
+        # single replace. a trailing "\n" does not start a new line.
+        if not text:
+            return text
+        prefix = indent_chars * level
+        ret = prefix + text.replace("\n", "\n" + prefix)
+        if text.endswith("\n"):
+            ret = ret[: len(ret) - len(prefix)]
+        return ret
+
     text_lines = text.splitlines(keepends=True)
 
     if isinstance(indent_chars, str):
@@ -604,6 +707,13 @@ def profileit():  # pragma: nocover
         _PROF.disable()
 
 
+# diagnostics for one module all annotate the same source string, so
+# cache the split. str caches its own hash, so repeat lookups are cheap.
+@functools.lru_cache(maxsize=8)
+def _splitlines_cached(source_code: str) -> Tuple[str, ...]:
+    return tuple(source_code.splitlines(keepends=True))
+
+
 def annotate_source_code(
     source_code: str,
     lineno: int,
@@ -629,7 +739,7 @@ def annotate_source_code(
     if lineno is None:
         return ""
 
-    source_lines = source_code.splitlines(keepends=True)
+    source_lines = _splitlines_cached(source_code)
     if lineno < 1 or lineno > len(source_lines):
         raise ValueError("Line number is out of range")
 
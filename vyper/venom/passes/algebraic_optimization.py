@@ -1,4 +1,4 @@
-from vyper.utils import SizeLimits, int_bounds, int_log2, is_power_of_two, wrap256
+from vyper.utils import SizeLimits, int_bounds, pow2_shift, wrap256
 from vyper.venom.analysis.dfg import DFGAnalysis
 from vyper.venom.analysis.liveness import LivenessAnalysis
 from vyper.venom.basicblock import (
@@ -227,19 +227,22 @@ class AlgebraicOptimizationPass(IRPass):
                 self.updater.store(inst, operands[1])
                 return
 
-            if self._is_lit(operands[0]) and is_power_of_two(operands[0].value):
-                val = operands[0].value
+            if not self._is_lit(operands[0]):
+                return
+            val = operands[0].value
+            is_pow2, shift = pow2_shift(val)
+            if is_pow2:
                 # x % (2^n) -> x & (2^n - 1)
                 if inst.opcode == "mod":
                     self.updater.update(inst, "and", [IRLiteral(val - 1), operands[1]])
                     return
                 # x / (2^n) -> x >> n
                 if inst.opcode == "div":
-                    self.updater.update(inst, "shr", [operands[1], IRLiteral(int_log2(val))])
+                    self.updater.update(inst, "shr", [operands[1], IRLiteral(shift)])
                     return
                 # x * (2^n) -> x << n
                 if inst.opcode == "mul":
-                    self.updater.update(inst, "shl", [operands[1], IRLiteral(int_log2(val))])
+                    self.updater.update(inst, "shl", [operands[1], IRLiteral(shift)])
                     return
             return
 
@@ -1,6 +1,6 @@
 from collections import defaultdict
 
-from vyper.utils import OrderedSet, uniq
+from vyper.utils import OrderedSet, uniq_list
 from vyper.venom import effects
 from vyper.venom.analysis import DFGAnalysis, LivenessAnalysis, ReachableAnalysis
 from vyper.venom.basicblock import IRBasicBlock, IRInstruction
@@ -88,7 +88,7 @@ class RemoveUnusedVariablesPass(IRPass):
         if len(uses) > 0:
             return
 
-        for operand in uniq(inst.get_input_variables()):
+        for operand in uniq_list(inst.get_input_variables()):
             self.dfg.remove_use(operand, inst)
             new_uses = self.dfg.get_uses(operand)
             self.work_list.addmany(new_uses)